@@ -0,0 +1,10 @@
+# Настройки gunicorn (файл подхватывается автоматически при запуске из корня проекта: gunicorn main:app)
+from secure_execution import secure_execute_program
+
+def on_starting(server):
+    """
+    Прогревает Docker-образы всех языков один раз в мастер-процессе до запуска воркеров.
+    Воркеры создаются через fork и наследуют список временно недоступных языков.
+    Если Docker недоступен или не прогрелся ни один язык, gunicorn не запускается.
+    """
+    secure_execute_program.warm_up_languages()
@@ -4,6 +4,12 @@ from secure_execution import secure_execute_program
 
 app = flask.Flask(__name__)
 
+# Прогрев Docker-образов выполняется один раз при старте, а не при импорте модуля:
+# - python main.py — перед app.run() (см. ниже);
+# - gunicorn main:app — в хуке on_starting мастер-процесса (gunicorn.conf.py);
+# - flask run — отдельной командой перед запуском: flask --app main warm-up
+#   (образы будут скачаны заранее, но недоступные языки сервер не отслеживает).
+
 
 @app.route('/', methods = ['GET'])
 def index_front():
@@ -18,7 +24,12 @@ def index_back():
     stdout, stderr, status_code = secure_execute_program.start_program(code, stdin, lang)
     return flask.jsonify({'stdout': stdout, 'stderr': stderr, 'status_code': status_code})
 
+@app.cli.command('warm-up')
+def warm_up_command():
+    secure_execute_program.warm_up_languages()
+
 
 if __name__ == '__main__':
+    secure_execute_program.warm_up_languages()
     app.run('0.0.0.0', 5005)
 
@@ -3,3 +3,5 @@ DEFAULT_CPU = 0.5           # Ограничение на использован
 DEFAULT_MEMORY = 512        # Ограничение на использование памяти (в мегабайтах)
 DEFAULT_TIMEOUT = 5         # Лимит времени выполнения (в секундах)
 WORKSPACE = './workspace'   # Путь к рабочему пространству для временных файлов
+WARMUP_TIMEOUT = 600        # Общий лимит времени на проверку, скачивание и прогрев Docker-образа одного языка (в секундах)
+WARMUP_RETRY_INTERVAL = 60  # Минимальный интервал между повторными прогревами недоступного языка (в секундах)
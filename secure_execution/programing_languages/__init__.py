@@ -1 +1,129 @@
-from . import cpp_exec, python_exec, java_exec, c_exec, js_exec, rust_exec
\ No newline at end of file
+import importlib
+from typing import Callable
+
+from ..config import DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT
+
+APP_DIR = '/usr/src/app'   # Каталог рабочего пространства внутри контейнера
+
+# Реестр поддерживаемых языков. Каждая запись описывает:
+# - module / function: модуль-исполнитель и функция запуска (импортируются лениво, см. get_executor());
+# - image: Docker-образ, в котором компилируется и выполняется программа;
+# - source_file: имя файла с исходным кодом в рабочем пространстве (None — код передаётся через stdin/аргумент);
+# - binary: имя скомпилированного файла в рабочем пространстве (None — отдельного этапа компиляции нет);
+# - compile / run: полные шаблоны команд компиляции и запуска, см. get_command() (compile = None, если компиляции нет);
+#   {source_file} и {binary} заменяются путями в APP_DIR, аргумент {program} — кодом программы;
+# - limits: ограничения по умолчанию (cpu, memory, timeout).
+LANGUAGES = {
+    'python': {
+        'module': 'python_exec',
+        'function': 'execute_python_program',
+        'image': 'python:3.10-slim',
+        'source_file': None,
+        'binary': None,
+        'compile': None,
+        'run': ['python', '-c', '{program}'],
+        'limits': {'cpu': DEFAULT_CPU, 'memory': DEFAULT_MEMORY, 'timeout': DEFAULT_TIMEOUT},
+    },
+    'js': {
+        'module': 'js_exec',
+        'function': 'execute_js_program',
+        'image': 'node:16-slim',
+        'source_file': None,
+        'binary': None,
+        'compile': None,
+        'run': ['node', '-e', '{program}'],
+        'limits': {'cpu': DEFAULT_CPU, 'memory': DEFAULT_MEMORY, 'timeout': DEFAULT_TIMEOUT},
+    },
+    'c': {
+        'module': 'c_exec',
+        'function': 'execute_c_program',
+        'image': 'gcc:latest',
+        'source_file': None,
+        'binary': 'compile_c_program',
+        'compile': ['gcc', '-x', 'c', '-', '-o', '{binary}'],
+        'run': ['{binary}'],
+        'limits': {'cpu': DEFAULT_CPU, 'memory': DEFAULT_MEMORY, 'timeout': DEFAULT_TIMEOUT},
+    },
+    'cpp': {
+        'module': 'cpp_exec',
+        'function': 'execute_cpp_program',
+        'image': 'gcc:latest',
+        'source_file': None,
+        'binary': 'compile_cpp_program',
+        'compile': ['g++', '-x', 'c++', '-', '-o', '{binary}'],
+        'run': ['{binary}'],
+        'limits': {'cpu': DEFAULT_CPU, 'memory': DEFAULT_MEMORY, 'timeout': DEFAULT_TIMEOUT},
+    },
+    'java': {
+        'module': 'java_exec',
+        'function': 'execute_java_program',
+        'image': 'openjdk:17-jdk-slim',
+        'source_file': 'source.java',
+        'binary': None,
+        'compile': None,
+        'run': ['java', '{source_file}'],   # java компилирует файл в памяти перед запуском
+        'limits': {'cpu': DEFAULT_CPU, 'memory': DEFAULT_MEMORY, 'timeout': DEFAULT_TIMEOUT},
+    },
+    'rust': {
+        'module': 'rust_exec',
+        'function': 'execute_rust_program',
+        'image': 'rust:latest',
+        'source_file': 'source.rs',
+        'binary': 'compile_rust_program',
+        'compile': ['rustc', '{source_file}', '-o', '{binary}'],
+        'run': ['{binary}'],
+        'limits': {'cpu': DEFAULT_CPU, 'memory': DEFAULT_MEMORY, 'timeout': DEFAULT_TIMEOUT},
+    },
+}
+
+def get_command(spec: dict, stage: str, program: str = '') -> list[str]:
+    """
+    Собирает команду этапа для записи реестра, подставляя пути к файлам внутри контейнера и код программы.
+
+    Параметры:
+    - spec (dict): Запись реестра LANGUAGES.
+    - stage (str): Этап: 'compile' или 'run'.
+    - program (str): Код программы для аргумента {program}.
+
+    Возвращает:
+    list[str]: Команда, в которой {source_file} и {binary} заменены на пути в APP_DIR, а {program} — кодом программы.
+    """
+    paths = {
+        'source_file': f'{APP_DIR}/{spec["source_file"]}',
+        'binary': f'{APP_DIR}/{spec["binary"]}',
+    }
+    # Код программы подставляется целым аргументом без format(), чтобы фигурные скобки в нём не разбирались
+    return [program if arg == '{program}' else arg.format(**paths) for arg in spec[stage]]
+
+def get_toolchain(spec: dict) -> str:
+    """
+    Возвращает имя компилятора или интерпретатора языка (первый элемент команды компиляции,
+    а при её отсутствии — команды запуска).
+
+    Параметры:
+    - spec (dict): Запись реестра LANGUAGES.
+
+    Возвращает:
+    str: Имя исполняемого файла в образе.
+    """
+    return (spec['compile'] or spec['run'])[0]
+
+def get_executor(language: str) -> Callable | None:
+    """
+    Возвращает функцию запуска программы для указанного языка.
+    Модуль-исполнитель импортируется при первом обращении к языку и далее берётся из sys.modules.
+
+    Параметры:
+    - language (str): Язык программирования (ключ реестра LANGUAGES).
+
+    Возвращает:
+    Callable | None: Функция вида (program, stdin, cpu, memory, timeout) -> (stdout, stderr, status)
+                     или None, если язык не поддерживается.
+    """
+    if not isinstance(language, str):
+        return None
+    spec = LANGUAGES.get(language)
+    if spec is None:
+        return None
+    module = importlib.import_module(f'.{spec["module"]}', __name__)
+    return getattr(module, spec['function'])
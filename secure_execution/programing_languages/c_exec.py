@@ -1,9 +1,10 @@
 import subprocess
 
 from .. import workspace_tool
+from . import LANGUAGES, get_command
 from ..config import DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT
 
-COMPILING_FILE_NAME = 'compile_c_program'
+LANGUAGE = LANGUAGES['c']
 
 def compile_c_program(program: str, workspace_id: str, \
     cpu: float = DEFAULT_CPU, memory: int = DEFAULT_MEMORY, timeout: float = DEFAULT_TIMEOUT) -> tuple[str, str, str]:
@@ -31,8 +32,8 @@ def compile_c_program(program: str, workspace_id: str, \
         f'--memory={memory}m',
         '--network=none',
         '-v', f'{path_to_workspace}:/usr/src/app',
-        'gcc:latest',
-        "gcc", "-x", "c", "-", "-o", f'/usr/src/app/{COMPILING_FILE_NAME}'
+        LANGUAGE['image'],
+        *get_command(LANGUAGE, 'compile')
     ]
     try:
         proc = subprocess.run(cmd, input=program, text=True, timeout=timeout, capture_output=True)
@@ -67,7 +68,7 @@ def run_c_program(workspace_id: str, stdin: str, \
         '--network=none',
         '--read-only',
         '-v', f'{path_to_workspace}:/usr/src/app',
-        'gcc:latest', f'/usr/src/app/{COMPILING_FILE_NAME}'
+        LANGUAGE['image'], *get_command(LANGUAGE, 'run')
     ]
     try:
         proc = subprocess.run(cmd, input=stdin, text=True, timeout=timeout, capture_output=True)
@@ -2,10 +2,11 @@ import subprocess
 import os
 
 from .. import workspace_tool
+from . import LANGUAGES, get_command
 from ..config import DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT
 
 
-JAVA_FILENAME = 'source.java'
+LANGUAGE = LANGUAGES['java']
 
 def create_java_file(path_to_workspace, program):
     """
@@ -15,7 +16,7 @@ def create_java_file(path_to_workspace, program):
     - path_to_workspace (str): Путь к рабочему пространству.
     - program (str): Код программы на Java, который нужно записать в файл.
     """
-    with open(os.path.join(path_to_workspace, JAVA_FILENAME), 'w') as file:
+    with open(os.path.join(path_to_workspace, LANGUAGE['source_file']), 'w') as file:
         file.write(program)
 
 def execute_java_program(program: str, stdin: str, \
@@ -51,8 +52,8 @@ def execute_java_program(program: str, stdin: str, \
         '--network=none',  # Отключение сетевого доступа.
         '--read-only',  # Запуск в режиме только для чтения (для безопасности).
         '-v', f'{path_to_workspace}:/usr/src/app',  # Монтирование рабочего пространства в контейнер.
-        'openjdk:17-jdk-slim',  # Использование образа OpenJDK 17.
-        'java', f'/usr/src/app/{JAVA_FILENAME}'  # Выполнение Java программы.
+        LANGUAGE['image'],  # Образ OpenJDK из реестра языков.
+        *get_command(LANGUAGE, 'run')  # Выполнение Java программы.
     ]
     
     try:
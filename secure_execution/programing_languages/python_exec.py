@@ -1,7 +1,10 @@
 import subprocess
 
+from . import LANGUAGES, get_command
 from ..config import DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT
 
+LANGUAGE = LANGUAGES['python']
+
 def execute_python_program(program: str, stdin: str, \
     cpu: float = DEFAULT_CPU, memory: int = DEFAULT_MEMORY, timeout: float = DEFAULT_TIMEOUT) -> tuple[str, str, str]:
     """
@@ -26,8 +29,8 @@ def execute_python_program(program: str, stdin: str, \
         f'--memory={memory}m',
         '--network=none',
         '--read-only',
-        'python:3.10-slim',
-        'python', '-c', program
+        LANGUAGE['image'],
+        *get_command(LANGUAGE, 'run', program)
     ]
     try:
         proc = subprocess.run(cmd, input=stdin, text=True, timeout=timeout, capture_output=True)
@@ -2,11 +2,11 @@ import subprocess
 import os
 
 from .. import workspace_tool
+from . import LANGUAGES, get_command
 from ..config import DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT
 
 
-RUST_FILENAME = 'source.rs'
-COMPILE_FILE = 'compile_rust_program'
+LANGUAGE = LANGUAGES['rust']
 
 def create_rust_file(path_to_workspace, program):
     """
@@ -16,7 +16,7 @@ def create_rust_file(path_to_workspace, program):
     - path_to_workspace (str): Путь к рабочему пространству.
     - program (str): Код программы на Java, который нужно записать в файл.
     """
-    with open(os.path.join(path_to_workspace, RUST_FILENAME), 'w') as file:
+    with open(os.path.join(path_to_workspace, LANGUAGE['source_file']), 'w') as file:
         file.write(program)
 
 def compile_rust_program(workspace_id: str, \
@@ -30,8 +30,8 @@ def compile_rust_program(workspace_id: str, \
         f'--memory={memory}m',
         '--network=none',
         '-v', f'{path_to_workspace}:/usr/src/app',
-        'rust:latest',
-        'rustc', f'/usr/src/app/{RUST_FILENAME}', '-o', f'/usr/src/app/{COMPILE_FILE}'
+        LANGUAGE['image'],
+        *get_command(LANGUAGE, 'compile')
     ]
     try:
         proc = subprocess.run(cmd, text=True, timeout=timeout, capture_output=True)
@@ -51,7 +51,7 @@ def run_rust_program(workspace_id: str, stdin: str, \
         '--network=none',
         '--read-only',
         '-v', f'{path_to_workspace}:/usr/src/app',
-        'rust:latest', f'/usr/src/app/{COMPILE_FILE}'
+        LANGUAGE['image'], *get_command(LANGUAGE, 'run')
     ]
     try:
         proc = subprocess.run(cmd, input=stdin, text=True, timeout=timeout, capture_output=True)
@@ -1,46 +1,174 @@
-import os
 import subprocess
-from uuid import uuid4
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from . import programing_languages
-from .config import DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT, WORKSPACE
+from .config import WARMUP_TIMEOUT, WARMUP_RETRY_INTERVAL
+
+# Языки, которые не удалось прогреть: они поддерживаются, но временно недоступны (см. warm_up_languages())
+UNAVAILABLE_LANGUAGES = set()
+_last_warm_up_attempt = {}          # Время последней попытки прогрева недоступного языка
+_warm_up_lock = threading.Lock()
 
 def start_program(program: str, stdin: str = '', language: str = 'python', \
-    cpu: float = DEFAULT_CPU, memory: int = DEFAULT_MEMORY, timeout: float = DEFAULT_TIMEOUT) -> tuple[str, str, str]:
+    cpu: float | None = None, memory: int | None = None, timeout: float | None = None) -> tuple[str, str, str]:
     """
     Выполняет программы на различных языках программирования в изолированном окружении.
 
     Параметры:
     - program (str): Код программы.
     - stdin (str): Входные данные.
-    - language (str): Язык программирования (поддерживается: 'python', 'cpp', 'c', 'java', 'js', 'rust).
-    - cpu (float): Ограничение на использование процессора.
-    - memory (int): Ограничение на использование памяти в мегабайтах.
-    - timeout (float): Лимит времени выполнения.
+    - language (str): Язык программирования (ключ реестра programing_languages.LANGUAGES: 'python', 'cpp', 'c', 'java', 'js', 'rust').
+    - cpu (float | None): Ограничение на использование процессора (None — значение по умолчанию для языка).
+    - memory (int | None): Ограничение на использование памяти в мегабайтах (None — значение по умолчанию для языка).
+    - timeout (float | None): Лимит времени выполнения (None — значение по умолчанию для языка).
 
     Возвращает:
     tuple[str, str, str]: Кортеж (stdout, stderr, status_code), где:
                           - stdout (str): Стандартный вывод программы.
                           - stderr (str): Сообщения об ошибках выполнения.
-                          - status_code (str): Код статуса выполнения ('ne' для успешного выполнения, 're' для ошибки выполнения, 'ce' для ошибки компиляции, None для неподдерживаемого языка).
-    """
-    if language == 'python':
-        stdout, stderr, status_code = programing_languages.python_exec.execute_python_program(program, stdin, cpu, memory, timeout)
-        return (stdout, stderr, status_code)
-    elif language == 'cpp':
-        stdout, stderr, status_code = programing_languages.cpp_exec.execute_cpp_program(program, stdin, cpu, memory, timeout)
-        return (stdout, stderr, status_code)
-    elif language == 'java':
-        stdout, stderr, status_code = programing_languages.java_exec.execute_java_program(program, stdin, cpu, memory, timeout)
-        return (stdout, stderr, status_code)
-    elif language == 'c':
-        stdout, stderr, status_code = programing_languages.c_exec.execute_c_program(program, stdin, cpu, memory, timeout)
-        return (stdout, stderr, status_code)
-    elif language == 'js':
-        stdout, stderr, status_code = programing_languages.js_exec.execute_js_program(program, stdin, cpu, memory, timeout)
-        return (stdout, stderr, status_code)
-    elif language == 'rust':
-        stdout, stderr, status_code = programing_languages.rust_exec.execute_rust_program(program, stdin, cpu, memory, timeout)
-        return (stdout, stderr, status_code)
-    else:
+                          - status_code (str): Код статуса выполнения ('ne' для успешного выполнения, 're' для ошибки выполнения, 'ce' для ошибки компиляции, None для неподдерживаемого или временно недоступного языка).
+    """
+    executor = programing_languages.get_executor(language)
+    if executor is None:
         return ('', 'Error: language not supported', None)
+    if language in UNAVAILABLE_LANGUAGES:
+        retry_warm_up(language)
+        return ('', 'Error: language temporarily unavailable', None)
+
+    limits = programing_languages.LANGUAGES[language]['limits']
+    cpu = limits['cpu'] if cpu is None else cpu
+    memory = limits['memory'] if memory is None else memory
+    timeout = limits['timeout'] if timeout is None else timeout
+
+    stdout, stderr, status_code = executor(program, stdin, cpu, memory, timeout)
+    return (stdout, stderr, status_code)
+
+def warm_up_language(language: str, timeout: float = WARMUP_TIMEOUT) -> float | None:
+    """
+    Проверяет наличие Docker-образа языка (при отсутствии скачивает его) и запускает в нём
+    компилятор или интерпретатор с --version с ограничениями языка по умолчанию,
+    чтобы первый пользовательский запрос не тратил время на холодный старт.
+
+    Параметры:
+    - language (str): Язык программирования (ключ реестра programing_languages.LANGUAGES).
+    - timeout (float): Общий лимит времени на проверку, скачивание и пробный запуск в секундах.
+
+    Возвращает:
+    float | None: Время прогрева в секундах или None, если образ или инструменты в нём недоступны.
+    """
+    spec = programing_languages.LANGUAGES[language]
+    image = spec['image']
+    started = time.monotonic()
+    deadline = started + timeout
+
+    def run_step(cmd: list[str]) -> bool:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        proc = subprocess.run(cmd, timeout=remaining, capture_output=True)
+        return proc.returncode == 0
+
+    cmd = [
+        'docker', 'run', '--rm',
+        f'--cpus={spec["limits"]["cpu"]}',
+        f'--memory={spec["limits"]["memory"]}m',
+        '--network=none',
+        '--read-only',
+        image, programing_languages.get_toolchain(spec), '--version'
+    ]
+    try:
+        if not run_step(['docker', 'image', 'inspect', image]) and not run_step(['docker', 'pull', image]):
+            return None
+        if not run_step(cmd):
+            return None
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    return time.monotonic() - started
+
+def check_docker(timeout: float = WARMUP_TIMEOUT) -> bool:
+    """
+    Проверяет, что Docker установлен и его демон отвечает.
+
+    Параметры:
+    - timeout (float): Лимит времени ожидания ответа в секундах.
+
+    Возвращает:
+    bool: True, если Docker доступен.
+    """
+    try:
+        proc = subprocess.run(['docker', 'info'], timeout=timeout, capture_output=True)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+    return proc.returncode == 0
+
+def warm_up_languages() -> dict[str, float | None]:
+    """
+    Прогревает все языки из реестра programing_languages.LANGUAGES и печатает время прогрева.
+    Языки, которые прогреть не удалось, добавляются в UNAVAILABLE_LANGUAGES (start_program отвечает
+    'language temporarily unavailable' и повторяет прогрев в фоне), о чём сообщается в stderr.
+
+    Возвращает:
+    dict[str, float | None]: Словарь {язык: время прогрева в секундах или None, если прогрев не удался}.
+
+    Исключения:
+    - RuntimeError: Если Docker недоступен или не удалось прогреть ни один язык.
+    """
+    if not check_docker():
+        raise RuntimeError('Warm-up error: docker is unreachable')
+
+    languages = list(programing_languages.LANGUAGES)
+    with ThreadPoolExecutor(max_workers=len(languages)) as pool:
+        timings = dict(zip(languages, pool.map(warm_up_language, languages)))
+
+    for language, warm_up_time in timings.items():
+        image = programing_languages.LANGUAGES[language]['image']
+        if warm_up_time is None:
+            mark_unavailable(language)
+            print(f'warm-up {language} ({image}): failed, language temporarily unavailable', file=sys.stderr)
+        else:
+            UNAVAILABLE_LANGUAGES.discard(language)
+            print(f'warm-up {language} ({image}): {warm_up_time:.2f}s')
+
+    if all(warm_up_time is None for warm_up_time in timings.values()):
+        raise RuntimeError('Warm-up error: no language could be warmed up')
+    return timings
+
+def mark_unavailable(language: str) -> None:
+    """
+    Помечает язык как временно недоступный.
+
+    Параметры:
+    - language (str): Язык программирования (ключ реестра programing_languages.LANGUAGES).
+    """
+    with _warm_up_lock:
+        UNAVAILABLE_LANGUAGES.add(language)
+        _last_warm_up_attempt[language] = time.monotonic()
+
+def retry_warm_up(language: str) -> None:
+    """
+    Запускает в фоновом потоке повторный прогрев недоступного языка, если с прошлой попытки
+    прошло не меньше WARMUP_RETRY_INTERVAL секунд. При успехе язык снова становится доступным.
+
+    Параметры:
+    - language (str): Язык программирования (ключ реестра programing_languages.LANGUAGES).
+    """
+    with _warm_up_lock:
+        last_attempt = _last_warm_up_attempt.get(language)
+        if last_attempt is not None and time.monotonic() - last_attempt < WARMUP_RETRY_INTERVAL:
+            return
+        # Отметка ставится до запуска потока, чтобы параллельные запросы не запускали повторный прогрев
+        _last_warm_up_attempt[language] = time.monotonic()
+
+    def retry() -> None:
+        warm_up_time = warm_up_language(language)
+        with _warm_up_lock:
+            _last_warm_up_attempt[language] = time.monotonic()
+            if warm_up_time is not None:
+                UNAVAILABLE_LANGUAGES.discard(language)
+        if warm_up_time is not None:
+            print(f'warm-up {language}: recovered after {warm_up_time:.2f}s', file=sys.stderr)
+
+    threading.Thread(target=retry, daemon=True).start()
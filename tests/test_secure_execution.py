@@ -0,0 +1,102 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from secure_execution import programing_languages, secure_execute_program
+from secure_execution.config import DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT
+
+
+@pytest.mark.parametrize('language, stage, expected', [
+    ('python', 'run', ['python', '-c', 'print({1})']),
+    ('js', 'run', ['node', '-e', 'print({1})']),
+    ('c', 'compile', ['gcc', '-x', 'c', '-', '-o', '/usr/src/app/compile_c_program']),
+    ('c', 'run', ['/usr/src/app/compile_c_program']),
+    ('cpp', 'compile', ['g++', '-x', 'c++', '-', '-o', '/usr/src/app/compile_cpp_program']),
+    ('cpp', 'run', ['/usr/src/app/compile_cpp_program']),
+    ('java', 'run', ['java', '/usr/src/app/source.java']),
+    ('rust', 'compile', ['rustc', '/usr/src/app/source.rs', '-o', '/usr/src/app/compile_rust_program']),
+    ('rust', 'run', ['/usr/src/app/compile_rust_program']),
+])
+def test_get_command(language, stage, expected):
+    spec = programing_languages.LANGUAGES[language]
+    assert programing_languages.get_command(spec, stage, 'print({1})') == expected
+
+@pytest.mark.parametrize('language, toolchain', [
+    ('python', 'python'), ('js', 'node'), ('c', 'gcc'), ('cpp', 'g++'), ('java', 'java'), ('rust', 'rustc'),
+])
+def test_get_toolchain(language, toolchain):
+    assert programing_languages.get_toolchain(programing_languages.LANGUAGES[language]) == toolchain
+
+def test_get_executor_imports_lazily():
+    module_name = 'secure_execution.programing_languages.rust_exec'
+    sys.modules.pop(module_name, None)
+    importlib.reload(programing_languages)
+    assert module_name not in sys.modules
+
+    executor = programing_languages.get_executor('rust')
+
+    assert module_name in sys.modules
+    assert executor is sys.modules[module_name].execute_rust_program
+
+@pytest.mark.parametrize('language', ['brainfuck', None, ['python'], {'python': 1}])
+def test_unsupported_language(language):
+    assert programing_languages.get_executor(language) is None
+    assert secure_execute_program.start_program('', '', language) == ('', 'Error: language not supported', None)
+
+def test_start_program_fills_default_limits(monkeypatch):
+    calls = []
+    monkeypatch.setattr(programing_languages, 'get_executor', lambda language: lambda *args: calls.append(args) or ('', '', 'ne'))
+
+    secure_execute_program.start_program('code', 'stdin', 'python')
+    secure_execute_program.start_program('code', 'stdin', 'python', cpu=1, memory=64, timeout=2)
+
+    assert calls == [
+        ('code', 'stdin', DEFAULT_CPU, DEFAULT_MEMORY, DEFAULT_TIMEOUT),
+        ('code', 'stdin', 1, 64, 2),
+    ]
+
+def test_start_program_unavailable_language(monkeypatch):
+    retried = []
+    monkeypatch.setattr(secure_execute_program, 'UNAVAILABLE_LANGUAGES', {'python'})
+    monkeypatch.setattr(secure_execute_program, 'retry_warm_up', retried.append)
+
+    assert secure_execute_program.start_program('', '', 'python') == ('', 'Error: language temporarily unavailable', None)
+    assert retried == ['python']
+
+def test_warm_up_language_uses_one_deadline(monkeypatch):
+    clock = iter([0, 0, 100, 700, 700])
+    timeouts = []
+
+    def fake_run(cmd, timeout, capture_output):
+        timeouts.append(timeout)
+        return subprocess.CompletedProcess(cmd, 1 if cmd[1] == 'image' else 0)
+
+    monkeypatch.setattr(secure_execute_program.time, 'monotonic', lambda: next(clock))
+    monkeypatch.setattr(secure_execute_program.subprocess, 'run', fake_run)
+
+    # inspect получает весь лимит, pull — остаток, а на запуск времени не остаётся
+    assert secure_execute_program.warm_up_language('rust', timeout=600) is None
+    assert timeouts == [600, 500]
+
+def test_warm_up_languages_fails_without_docker(monkeypatch):
+    def fake_run(cmd, timeout, capture_output):
+        raise FileNotFoundError('docker')
+
+    monkeypatch.setattr(secure_execute_program.subprocess, 'run', fake_run)
+
+    with pytest.raises(RuntimeError):
+        secure_execute_program.warm_up_languages()
+    assert set(programing_languages.LANGUAGES) == {'python', 'js', 'c', 'cpp', 'java', 'rust'}
+
+def test_warm_up_languages_marks_failed_languages(monkeypatch):
+    monkeypatch.setattr(secure_execute_program, 'UNAVAILABLE_LANGUAGES', set())
+    monkeypatch.setattr(secure_execute_program, 'check_docker', lambda: True)
+    monkeypatch.setattr(secure_execute_program, 'warm_up_language', lambda language: None if language == 'rust' else 1.0)
+
+    timings = secure_execute_program.warm_up_languages()
+
+    assert timings['rust'] is None and timings['python'] == 1.0
+    assert secure_execute_program.UNAVAILABLE_LANGUAGES == {'rust'}
+    assert 'rust' in programing_languages.LANGUAGES